@@ -64,6 +64,20 @@ class LastProblemCheckEventMixin(object):
         if parsed_tuple_or_none is not None:
             yield parsed_tuple_or_none
 
+    def combiner(self, key, values):
+        """
+        Pass on only the most recent problem_check event seen by a mapper for a user and problem.
+
+        Args:
+            key:  (problem_id, username)
+            values:  iterator of (timestamp, problem_check_info)
+
+        Yields:
+            a single (key, (timestamp, problem_check_info)) tuple, for the most recent event.
+
+        """
+        yield key, max(values)
+
     def reducer(self, _key, values):
         """
         Calculate a list of answers from the final response of a user to a problem in a course.
@@ -95,17 +109,18 @@ class LastProblemCheckEventMixin(object):
               'variant': seed value
 
         """
-        # Sort input values (by timestamp) to easily detect the most
-        # recent answer to a problem by a particular user.  Note that
-        # this assumes the timestamp values (strings) are in ISO
+        # Take the maximum input value (by timestamp) to detect the
+        # most recent answer to a problem by a particular user.  Note
+        # that this assumes the timestamp values (strings) are in ISO
         # representation, so that the tuples will be ordered in
         # ascending time value.
-        values = sorted(values)
-        if not values:
+        try:
+            most_recent_value = max(values)
+        except ValueError:
+            # There were no values for this key.
             return
 
-        # Get the last entry.
-        _timestamp, most_recent_event = values[-1]
+        _timestamp, most_recent_event = most_recent_value
 
         for answer in self._generate_answers(most_recent_event):
             yield answer
@@ -18,6 +18,12 @@ log = logging.getLogger(__name__)
 UNENROLLED = -1
 ENROLLED = 1
 
+# Action value for each event type that changes enrollment.
+ACTION_VALUE_FOR_EVENT_TYPE = {
+    'edx.course.enrollment.activated': ENROLLED,
+    'edx.course.enrollment.deactivated': UNENROLLED,
+}
+
 ################################
 # Task Map-Reduce definitions
 ################################
@@ -281,12 +287,11 @@ def get_explicit_enrollment_output(line):
         log.error("encountered event with no event_type: %s", event)
         return None
 
-    # convert the type to a value:
-    if event_type == 'edx.course.enrollment.activated':
-        action_value = ENROLLED
-    elif event_type == 'edx.course.enrollment.deactivated':
-        action_value = UNENROLLED
-    else:
+    # convert the type to a value (the decoded event_type may be any JSON value, including unhashable ones):
+    if not isinstance(event_type, basestring):
+        return None
+    action_value = ACTION_VALUE_FOR_EVENT_TYPE.get(event_type)
+    if action_value is None:
         # not an enrollment event...
         return None
 
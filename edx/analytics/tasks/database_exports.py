@@ -5,6 +5,7 @@ per organization, etc.
 
 import csv
 from collections import namedtuple
+import itertools
 import logging
 
 import luigi
@@ -13,6 +14,7 @@ from edx.analytics.tasks.mapreduce import MultiOutputMapReduceJobTask
 from edx.analytics.tasks.pathutil import PathSetTask
 from edx.analytics.tasks.sqoop import SqoopImportFromMysql
 from edx.analytics.tasks.util import csv_util
+from edx.analytics.tasks.util.batched_write import write_lines_in_batches
 from edx.analytics.tasks.url import url_path_join, get_target_from_url
 import edx.analytics.tasks.util.opaque_key_util as opaque_key_util
 
@@ -91,12 +93,7 @@ class StudentModulePerCourseTask(MultiOutputMapReduceJobTask):
         """
 
         header = '\t'.join(STUDENT_MODULE_FIELDS)
-        output_file.write(header)
-        output_file.write('\n')
-
-        for row in rows:
-            output_file.write(row)
-            output_file.write('\n')
+        write_lines_in_batches(output_file, itertools.chain([header], rows))
 
     def output_path_for_key(self, course_id):
         template = "{course_id}-courseware_studentmodule-{suffix}analytics.sql"
@@ -1,8 +1,10 @@
 """Compute metrics related to user enrollments in courses"""
 
+from collections import namedtuple
+import datetime
+import itertools
 import logging
 import textwrap
-import datetime
 
 import luigi
 
@@ -27,6 +29,11 @@ class CourseEnrollmentTask(EventLogSelectionMixin, MapReduceJobTask):
     output_root = luigi.Parameter()
 
     def mapper(self, line):
+        # Before parsing, check that the line contains something that suggests it's an enrollment event. The vast
+        # majority of lines are not, and this avoids decoding the JSON for all of them.
+        if 'edx.course.enrollment' not in line:
+            return
+
         value = self.get_event_and_date_string(line)
         if value is None:
             return
@@ -73,13 +80,14 @@ class CourseEnrollmentTask(EventLogSelectionMixin, MapReduceJobTask):
         return get_target_from_url(self.output_root)
 
 
-class EnrollmentEvent(object):
-    """The critical information necessary to process the event in the event stream."""
+# The critical information necessary to process the event in the event stream. Many of these are created for each
+# user, and namedtuple instances don't carry an instance dictionary.
+EnrollmentEvent = namedtuple('EnrollmentEvent', ['timestamp', 'datestamp', 'event_type'])
+
 
-    def __init__(self, timestamp, event_type):
-        self.timestamp = timestamp
-        self.datestamp = eventlog.timestamp_to_datestamp(timestamp)
-        self.event_type = event_type
+def create_enrollment_event(timestamp, event_type):
+    """Build an EnrollmentEvent, deriving its datestamp from the timestamp."""
+    return EnrollmentEvent(timestamp, eventlog.timestamp_to_datestamp(timestamp), event_type)
 
 
 class DaysEnrolledForEvents(object):
@@ -137,22 +145,35 @@ class DaysEnrolledForEvents(object):
 
     """
 
+    # One of these is created for every (course, user) pair, so avoid giving each of them an attribute dictionary.
+    __slots__ = (
+        'course_id', 'user_id', 'interval', 'sorted_events', 'first_event', 'state', 'previous_state', 'event',
+        'next_event',
+    )
+
     ENROLLED = 1
     UNENROLLED = 0
 
+    # Maps the current state and the type of the event being processed to the state the user is in afterwards. Any
+    # combination that is not listed here is an invalid transition that leaves the state unchanged.
+    STATE_TRANSITIONS = {
+        (ENROLLED, DEACTIVATED): UNENROLLED,
+        (UNENROLLED, ACTIVATED): ENROLLED,
+    }
+
     def __init__(self, course_id, user_id, interval, events):
         self.course_id = course_id
         self.user_id = user_id
         self.interval = interval
 
-        self.sorted_events = sorted(events)
         # After sorting, we can discard time information since we only care about date transitions.
-        self.sorted_events = [EnrollmentEvent(timestamp, value) for timestamp, value in self.sorted_events]
+        self.sorted_events = [create_enrollment_event(timestamp, value) for timestamp, value in sorted(events)]
         # Since each event looks ahead to see the time of the next event, insert a dummy event at then end that
         # indicates the end of the requested interval. If the user's last event is an enrollment activation event then
         # they are assumed to be enrolled up until the end of the requested interval. Note that the mapper ensures that
         # no events on or after date_b are included in the analyzed data set.
-        self.sorted_events.append(EnrollmentEvent(self.interval.date_b.isoformat(), None))  # pylint: disable=no-member
+        end_of_interval = self.interval.date_b.isoformat()  # pylint: disable=no-member
+        self.sorted_events.append(create_enrollment_event(end_of_interval, None))
 
         self.first_event = self.sorted_events[0]
 
@@ -174,10 +195,12 @@ class DaysEnrolledForEvents(object):
             tuple: An enrollment record for each day during which the user was enrolled in the course.
 
         """
-        # The last element of the list is a placeholder indicating the end of the interval. Don't process it.
-        for index in range(len(self.sorted_events) - 1):
-            self.event = self.sorted_events[index]
-            self.next_event = self.sorted_events[index + 1]
+        # Pair each event with the one that follows it. The last element of the list is a placeholder indicating the
+        # end of the interval, so it only ever appears as the next event and is never processed itself.
+        following_events = itertools.islice(self.sorted_events, 1, None)
+        for event, next_event in itertools.izip(self.sorted_events, following_events):
+            self.event = event
+            self.next_event = next_event
 
             self.change_state()
 
@@ -233,10 +256,9 @@ class DaysEnrolledForEvents(object):
 
         Note that in spite of our best efforts some events might be lost, causing invalid state transitions.
         """
-        if self.state == self.ENROLLED and self.event.event_type == DEACTIVATED:
-            self.state = self.UNENROLLED
-        elif self.state == self.UNENROLLED and self.event.event_type == ACTIVATED:
-            self.state = self.ENROLLED
+        new_state = self.STATE_TRANSITIONS.get((self.state, self.event.event_type))
+        if new_state is not None:
+            self.state = new_state
         else:
             log.warning(
                 'No state change for %s event. User %d is already in the requested state for course %s on %s.',
@@ -13,6 +13,7 @@ from edx.analytics.tasks.encrypt import make_encrypted_file
 from edx.analytics.tasks.mapreduce import MultiOutputMapReduceJobTask
 from edx.analytics.tasks.pathutil import EventLogSelectionMixin
 from edx.analytics.tasks.url import url_path_join, ExternalURL, get_target_from_url
+from edx.analytics.tasks.util.batched_write import write_lines_in_batches
 import edx.analytics.tasks.util.opaque_key_util as opaque_key_util
 
 log = logging.getLogger(__name__)
@@ -104,14 +105,15 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
         log.debug('Using org_id whitelist ["%s"]', '", "'.join(self.org_id_whitelist))
 
     def mapper(self, line):
+        # Every line in the file is either included or excluded together, so check that before paying to parse the line.
+        if not self.is_valid_input_file():
+            return
+
         value = self.get_event_and_date_string(line)
         if value is None:
             return
         event, date_string = value
 
-        if not self.is_valid_input_file():
-            return
-
         org_id = self.get_org_id(event)
         if org_id not in self.org_id_whitelist:
             log.debug('Unrecognized organization: org_id=%s', org_id or '')
@@ -176,9 +178,7 @@ class EventExportTask(EventLogSelectionMixin, MultiOutputMapReduceJobTask):
         with make_encrypted_file(output_file, key_file_targets) as encrypted_output_file:
             outfile = gzip.GzipFile(mode='wb', fileobj=encrypted_output_file)
             try:
-                for value in values:
-                    outfile.write(value.strip())
-                    outfile.write('\n')
+                write_lines_in_batches(outfile, (value.strip() for value in values))
             finally:
                 outfile.close()
 
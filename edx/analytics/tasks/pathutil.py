@@ -7,7 +7,6 @@ Supports outputs to HDFS, S3, and local FS.
 """
 
 import boto
-import datetime
 import fnmatch
 import logging
 import os
@@ -47,40 +46,54 @@ class PathSetTask(luigi.Task):
     def __init__(self, *args, **kwargs):
         super(PathSetTask, self).__init__(*args, **kwargs)
         self.s3_conn = None
+        # fnmatch.fnmatch() normalizes and looks up the translated pattern on every call, so translate the include
+        # patterns once.
+        self.include_regexes = [re.compile(fnmatch.translate(include_val)) for include_val in self.include]
+        self.requirements = None
+        self.outputs = None
 
     def generate_file_list(self):
         """Yield each individual path given a source folder and a set of file-matching expressions."""
+        for url in self._generate_urls():
+            yield ExternalURL(url)
+
+    def _generate_urls(self):
+        """Yield the URL of each file in the source folder that matches one of the include patterns."""
         if self.src.startswith('s3'):
             # connect lazily as needed:
             if self.s3_conn is None:
                 self.s3_conn = boto.connect_s3()
             for _bucket, _root, path in generate_s3_sources(self.s3_conn, self.src, self.include):
-                source = url_path_join(self.src, path)
-                yield ExternalURL(source)
+                yield url_path_join(self.src, path)
         else:
             # Apply the include patterns to the relative path below the src directory.
             for dirpath, _dirnames, files in os.walk(self.src):
                 for filename in files:
                     filepath = os.path.join(dirpath, filename)
                     relpath = os.path.relpath(filepath, self.src)
-                    if any(fnmatch.fnmatch(relpath, include_val) for include_val in self.include):
-                        yield ExternalURL(filepath)
+                    if any(include_regex.match(relpath) for include_regex in self.include_regexes):
+                        yield filepath
 
     def manifest_file_list(self):
         """Write each individual path to a manifest file and yield the path to that file."""
         manifest_target = get_target_from_url(self.manifest)
         if not manifest_target.exists():
+            # Stream the paths straight into the file, there is no need to construct a task for each one of them.
             with manifest_target.open('w') as manifest_file:
-                for external_url_task in self.generate_file_list():
-                    manifest_file.write(external_url_task.url + '\n')
+                for url in self._generate_urls():
+                    manifest_file.write(url + '\n')
 
         yield ExternalURL(self.manifest)
 
     def requires(self):
-        if self.manifest is not None:
-            return self.manifest_file_list()
-        else:
-            return self.generate_file_list()
+        # This method gets called several times. Avoid listing the source directory more than once by caching the first
+        # result.
+        if self.requirements is None:
+            if self.manifest is not None:
+                self.requirements = list(self.manifest_file_list())
+            else:
+                self.requirements = list(self.generate_file_list())
+        return self.requirements
 
     def complete(self):
         # An optimization: just declare that the task is always
@@ -90,7 +103,9 @@ class PathSetTask(luigi.Task):
         return True
 
     def output(self):
-        return [task.output() for task in self.requires()]
+        if self.outputs is None:
+            self.outputs = [task.output() for task in self.requires()]
+        return self.outputs
 
 
 class EventLogSelectionDownstreamMixin(object):
@@ -123,8 +138,8 @@ class EventLogSelectionTask(EventLogSelectionDownstreamMixin, luigi.WrapperTask)
         expand_interval: A time interval to add to the beginning and end of the interval to expand the windows of files
             captured.
         pattern: A regex with a named capture group for the date that approximates the date that the events within were
-            emitted. Note that the search interval is expanded, so events don't have to be in exactly the right file
-            in order for them to be processed.
+            emitted. The "date" group must capture a date formatted as %Y%m%d. Note that the search interval is
+            expanded, so events don't have to be in exactly the right file in order for them to be processed.
     """
 
     def __init__(self, *args, **kwargs):
@@ -133,6 +148,10 @@ class EventLogSelectionTask(EventLogSelectionDownstreamMixin, luigi.WrapperTask)
             self.interval.date_a - self.expand_interval,
             self.interval.date_b + self.expand_interval
         )
+        self.pattern_regex = re.compile(self.pattern)
+        # Dates extracted from file names are formatted as %Y%m%d, so they can be compared with these as strings.
+        self.lower_bound_date_string = self.interval.date_a.strftime('%Y%m%d')
+        self.upper_bound_date_string = self.interval.date_b.strftime('%Y%m%d')
         self.requirements = None
 
     def requires(self):
@@ -187,16 +206,23 @@ class EventLogSelectionTask(EventLogSelectionDownstreamMixin, luigi.WrapperTask)
 
         Presently filters first on pattern match and then on the datestamp extracted from the file name.
         """
-        match = re.match(self.pattern, url)
+        match = self.pattern_regex.match(url)
         if not match:
             log.debug('Excluding due to pattern mismatch: %s', url)
             return False
 
         # TODO: support patterns that don't contain a "date" group
 
-        parsed_datetime = datetime.datetime.strptime(match.group('date'), '%Y%m%d')
-        parsed_date = datetime.date(parsed_datetime.year, parsed_datetime.month, parsed_datetime.day)
-        should_include = parsed_date in self.interval
+        # Don't use strptime to parse the date, it is slow to do so for every file in the source. Instead rely on
+        # alphanumeric comparisons, which give the same ordering for dates formatted as %Y%m%d.
+        date_string = match.group('date')
+        if len(date_string) != 8 or not date_string.isdigit():
+            raise ValueError(
+                'The "date" group of pattern "{0}" must capture a date formatted as %Y%m%d, got "{1}" from {2}'.format(
+                    self.pattern, date_string, url
+                )
+            )
+        should_include = self.lower_bound_date_string <= date_string < self.upper_bound_date_string
 
         if should_include:
             log.debug('Including: %s', url)
@@ -216,8 +242,8 @@ class EventLogSelectionMixin(EventLogSelectionDownstreamMixin):
         source: A URL to a path that contains log files that contain the events.
         interval: The range of dates to export logs for.
         pattern: A regex with a named capture group for the date that approximates the date that the events within were
-            emitted. Note that the search interval is expanded, so events don't have to be in exactly the right file
-            in order for them to be processed.
+            emitted. The "date" group must capture a date formatted as %Y%m%d. Note that the search interval is
+            expanded, so events don't have to be in exactly the right file in order for them to be processed.
     """
 
     def requires(self):
@@ -250,7 +276,7 @@ class EventLogSelectionMixin(EventLogSelectionDownstreamMixin):
         # to do so. Instead rely on alphanumeric comparisons.  The
         # timestamp is ISO8601 formatted, so dates will look like
         # %Y-%m-%d.  For example: 2014-05-20.
-        date_string = event_time.split("T")[0]
+        date_string = event_time.partition("T")[0]
 
         if date_string < self.lower_bound_date_string or date_string >= self.upper_bound_date_string:
             return None
@@ -125,7 +125,7 @@ class LastProblemCheckEventMapTest(InitializeOpaqueKeysMixin, LastProblemCheckEv
 
     def assert_no_output_for(self, line):
         """Assert that an input line generates no output."""
-        self.assertEquals(tuple(self.task.mapper(line)), tuple())
+        self.assertFalse(list(self.task.mapper(line)))
 
     def test_non_problem_check_event(self):
         line = 'this is garbage'
@@ -311,6 +311,20 @@ class LastProblemCheckEventReduceTest(InitializeOpaqueKeysMixin, LastProblemChec
         answer_data = self._get_answer_data()
         self._check_output([input_data], {self.answer_id: answer_data})
 
+    def test_earlier_answer_event_ignored(self):
+        earlier_problem_data = self._create_problem_data_dict(answers={self.answer_id: "2"})
+        earlier_input_data = ("2013-12-15T15:38:32.805444", json.dumps(earlier_problem_data))
+        problem_data = self._create_problem_data_dict()
+        input_data = (self.timestamp, json.dumps(problem_data))
+        answer_data = self._get_answer_data()
+        self._check_output([input_data, earlier_input_data], {self.answer_id: answer_data})
+
+    def test_combiner_keeps_most_recent_event(self):
+        earlier_input_data = ("2013-12-15T15:38:32.805444", json.dumps(self._create_problem_data_dict()))
+        input_data = (self.timestamp, json.dumps(self._create_problem_data_dict()))
+        combiner_output = tuple(self.task.combiner(self.key, iter([earlier_input_data, input_data])))
+        self.assertEquals(combiner_output, ((self.key, input_data),))
+
     def test_one_correct_answer_event(self):
         problem_data = self._create_problem_data_dict(
             correct_map={self.answer_id: {"correctness": "correct"}}
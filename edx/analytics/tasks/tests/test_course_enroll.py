@@ -54,7 +54,7 @@ class CourseEnrollEventMapTest(InitializeOpaqueKeysMixin, unittest.TestCase):
 
     def assert_no_output_for(self, line):
         """Assert that an input line generates no output."""
-        self.assertEquals(tuple(self.task.mapper(line)), tuple())
+        self.assertFalse(list(self.task.mapper(line)))
 
     def test_non_enrollment_event(self):
         line = 'this is garbage'
@@ -75,6 +75,11 @@ class CourseEnrollEventMapTest(InitializeOpaqueKeysMixin, unittest.TestCase):
         line = self._create_event_log_line(event_type='edx.course.enrollment.unknown')
         self.assert_no_output_for(line)
 
+    def test_non_string_event_type(self):
+        for event_type in (['edx.course.enrollment.activated'], {'edx.course.enrollment.activated': 1}, 1):
+            line = self._create_event_log_line(event_type=event_type)
+            self.assert_no_output_for(line)
+
     def test_bad_datetime(self):
         line = self._create_event_log_line(time='this is a bogus time')
         self.assert_no_output_for(line)
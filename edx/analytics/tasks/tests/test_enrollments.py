@@ -1,5 +1,7 @@
 """Test enrollment computations"""
 
+import copy
+import itertools
 import json
 
 import luigi
@@ -8,6 +10,7 @@ from edx.analytics.tasks.enrollments import (
     CourseEnrollmentTask,
     DEACTIVATED,
     ACTIVATED,
+    create_enrollment_event,
 )
 from edx.analytics.tasks.tests import unittest
 from edx.analytics.tasks.tests.opaque_key_mixins import InitializeOpaqueKeysMixin, InitializeLegacyKeysMixin
@@ -62,7 +65,7 @@ class CourseEnrollmentTaskMapTest(InitializeOpaqueKeysMixin, unittest.TestCase):
 
     def assert_no_output_for(self, line):
         """Assert that an input line generates no output."""
-        self.assertEquals(tuple(self.task.mapper(line)), tuple())
+        self.assertFalse(list(self.task.mapper(line)))
 
     def test_non_enrollment_event(self):
         line = 'this is garbage'
@@ -112,10 +115,25 @@ class CourseEnrollmentTaskMapTest(InitializeOpaqueKeysMixin, unittest.TestCase):
         self.assertEquals(event, expected)
 
 
-class CourseEnrollmentTaskMapTest(InitializeLegacyKeysMixin, unittest.TestCase):
+class CourseEnrollmentTaskLegacyMapTest(InitializeLegacyKeysMixin, CourseEnrollmentTaskMapTest):
+    """Run same mapper() tests, but using legacy values for keys."""
     pass
 
 
+class EnrollmentEventTest(unittest.TestCase):
+    """Tests for the representation of events in the event stream."""
+
+    def test_create_enrollment_event(self):
+        event = create_enrollment_event('2014-01-01T00:00:00.000000', ACTIVATED)
+        self.assertEquals(event.timestamp, '2014-01-01T00:00:00.000000')
+        self.assertEquals(event.datestamp, '2014-01-01')
+        self.assertEquals(event.event_type, ACTIVATED)
+
+    def test_copy(self):
+        event = create_enrollment_event('2014-01-01T00:00:00.000000', ACTIVATED)
+        self.assertEquals(copy.deepcopy(event), event)
+
+
 class CourseEnrollmentTaskReducerTest(unittest.TestCase):
     """
     Tests to verify that events-per-day-per-user reducer works correctly.
@@ -126,9 +144,9 @@ class CourseEnrollmentTaskReducerTest(unittest.TestCase):
         self.course_id = 'foo/bar/baz'
         self.key = (self.course_id, self.user_id)
 
-    def _get_reducer_output(self, values):
-        """Run reducer with provided values hardcoded key."""
-        return tuple(self.task.reducer(self.key, values))
+    def _get_reducer_output(self, values, limit=1024):
+        """Run reducer with provided values hardcoded key, collecting no more than `limit` records."""
+        return tuple(itertools.islice(self.task.reducer(self.key, values), limit))
 
     def _check_output(self, inputs, expected):
         """Compare generated with expected output."""
@@ -3,12 +3,15 @@ Tests for event export tasks
 """
 
 import datetime
+import gzip
+import StringIO
 
 from luigi.date_interval import Year
 from mock import MagicMock, patch
 import yaml
 
 from edx.analytics.tasks.event_exports import EventExportTask
+from edx.analytics.tasks.util.batched_write import WRITE_BUFFER_SIZE
 from edx.analytics.tasks.tests import unittest
 from edx.analytics.tasks.tests.target import FakeTarget
 from edx.analytics.tasks.tests.opaque_key_mixins import InitializeOpaqueKeysMixin
@@ -333,6 +336,53 @@ class EventExportTestCase(InitializeOpaqueKeysMixin, unittest.TestCase):
         for path in ['something.gz', 'test://input/something.gz']:
             self.assertItemsEqual(self.run_mapper_for_file_path(path, self.EXAMPLE_EVENT), [])
 
+    def test_excluded_file_not_parsed(self):
+        self.task.init_local()
+
+        with patch('edx.analytics.tasks.pathutil.eventlog.parse_json_event') as mock_parse_json_event:
+            self.assertItemsEqual(self.run_mapper_for_server_file('foobar', self.EXAMPLE_EVENT), [])
+            self.assertFalse(mock_parse_json_event.called)
+
+    def run_multi_output_reducer(self, values):
+        """Run the reducer for a single organization, returning the decompressed output and the gzip file writes."""
+        self.task.init_local()
+        encrypted_output_file = StringIO.StringIO()
+        gzip_files = []
+
+        def create_gzip_file(*args, **kwargs):
+            """Create a real gzip file that records the calls made to write()."""
+            gzip_file = real_gzip_file(*args, **kwargs)
+            gzip_file.write = MagicMock(wraps=gzip_file.write)
+            gzip_files.append(gzip_file)
+            return gzip_file
+
+        real_gzip_file = gzip.GzipFile
+        with patch('edx.analytics.tasks.event_exports.make_encrypted_file') as mock_make_encrypted_file:
+            mock_make_encrypted_file.return_value.__enter__.return_value = encrypted_output_file
+            with patch('edx.analytics.tasks.event_exports.gzip.GzipFile', side_effect=create_gzip_file):
+                self.task.multi_output_reducer((self.EXAMPLE_DATE, 'FooX'), values, None)
+
+        self.assertEquals(len(gzip_files), 1)
+        output = gzip.GzipFile(fileobj=StringIO.StringIO(encrypted_output_file.getvalue())).read()
+        return output, gzip_files[0].write.call_count
+
+    def test_multi_output_reducer(self):
+        values = [self.EXAMPLE_EVENT + '\n', '  ' + self.EXAMPLE_EVENT + '\r\n']
+        output, write_count = self.run_multi_output_reducer(values)
+        self.assertEquals(output, ''.join(value.strip() + '\n' for value in values))
+        self.assertEquals(write_count, 1)
+
+    def test_multi_output_reducer_above_buffer_size(self):
+        values = [self.EXAMPLE_EVENT + '\n'] * ((2 * WRITE_BUFFER_SIZE) / len(self.EXAMPLE_EVENT) + 1)
+        output, write_count = self.run_multi_output_reducer(values)
+        self.assertEquals(output, ''.join(value.strip() + '\n' for value in values))
+        self.assertEquals(write_count, 3)
+
+    def test_multi_output_reducer_no_values(self):
+        output, write_count = self.run_multi_output_reducer([])
+        self.assertEquals(output, '')
+        self.assertEquals(write_count, 0)
+
     def test_missing_environment_variable(self):
         self.task.init_local()
         self.assertItemsEqual([output for output in self.task.mapper(self.EXAMPLE_EVENT) if output is not None], [])
@@ -1,13 +1,18 @@
 """Test selection of event log files."""
 
 import datetime
+import json
+import os
+import shutil
+import tempfile
 
 from mock import patch
 
+import luigi.hadoop
 from luigi.date_interval import Month
 
-from edx.analytics.tasks.pathutil import EventLogSelectionTask
-from edx.analytics.tasks.url import UncheckedExternalURL
+from edx.analytics.tasks.pathutil import EventLogSelectionMixin, EventLogSelectionTask, PathSetTask
+from edx.analytics.tasks.url import ExternalURL, UncheckedExternalURL
 from edx.analytics.tasks.tests import unittest
 from edx.analytics.tasks.tests.config import with_luigi_config
 
@@ -119,6 +124,16 @@ class EventLogSelectionTaskTest(unittest.TestCase):
         ]
         self.assertItemsEqual(matched_urls, expected_urls)
 
+    def test_malformed_date_group(self):
+        task = EventLogSelectionTask(
+            source=self.SOURCE,
+            interval=Month.parse('2014-03'),
+            pattern=r'.*?foo/tracking.log-(?P<date>\d{4}-\d{2}-\d{2}).*\.gz',
+            expand_interval=datetime.timedelta(0),
+        )
+        with self.assertRaises(ValueError):
+            task.should_include_url('s3://foo/tracking.log-2014-03-18.gz')
+
     def test_edge_urls(self):
         task = EventLogSelectionTask(
             source=self.SOURCE,
@@ -160,3 +175,100 @@ class EventLogSelectionTaskTest(unittest.TestCase):
             pattern='baz'
         )
         self.assertEquals(task.pattern, 'baz')
+
+
+class PathSetTaskTest(unittest.TestCase):
+    """Test selection of files from a local directory."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+        for path in ('tracking.log-20140301.gz', 'tracking.log', 'subdir/tracking.log-20140302.gz'):
+            full_path = os.path.join(self.temp_dir, path)
+            if not os.path.exists(os.path.dirname(full_path)):
+                os.makedirs(os.path.dirname(full_path))
+            with open(full_path, 'w') as temp_file:
+                temp_file.write('\n')
+
+    def test_include_patterns(self):
+        task = PathSetTask(src=self.temp_dir, include=['*.gz'])
+        self.assertItemsEqual(
+            task.requires(),
+            [
+                ExternalURL(os.path.join(self.temp_dir, 'tracking.log-20140301.gz')),
+                ExternalURL(os.path.join(self.temp_dir, 'subdir/tracking.log-20140302.gz')),
+            ]
+        )
+
+    def test_source_listed_once(self):
+        task = PathSetTask(src=self.temp_dir, include=['*.gz'])
+        with patch('edx.analytics.tasks.pathutil.os.walk', wraps=os.walk) as walk_mock:
+            requirements = task.requires()
+            self.assertEquals(task.requires(), requirements)
+            self.assertEquals(len(task.output()), 2)
+            # os.walk() calls itself for each subdirectory, so only count the calls for the source directory.
+            walked_dirs = [args[0] for args, _kwargs in walk_mock.call_args_list]
+            self.assertEquals(walked_dirs.count(self.temp_dir), 1)
+
+    def test_manifest(self):
+        manifest_path = os.path.join(self.temp_dir, 'input.manifest')
+        task = PathSetTask(src=self.temp_dir, include=['*.gz'], manifest=manifest_path)
+
+        with patch('edx.analytics.tasks.pathutil.ExternalURL', wraps=ExternalURL) as external_url_mock:
+            self.assertEquals(task.requires(), [ExternalURL(manifest_path)])
+            external_url_mock.assert_called_once_with(manifest_path)
+
+        with open(manifest_path, 'r') as manifest_file:
+            self.assertItemsEqual(
+                manifest_file.read().splitlines(),
+                [
+                    os.path.join(self.temp_dir, 'tracking.log-20140301.gz'),
+                    os.path.join(self.temp_dir, 'subdir/tracking.log-20140302.gz'),
+                ]
+            )
+
+
+class EventLogSelectionMixinTestTask(EventLogSelectionMixin, luigi.hadoop.JobTask):
+    """A minimal task that selects events using EventLogSelectionMixin."""
+    pass
+
+
+class EventLogSelectionMixinTest(unittest.TestCase):
+    """Test selection of events within the interval."""
+
+    def setUp(self):
+        self.task = EventLogSelectionMixinTestTask(interval=Month.parse('2014-03'))
+        self.task.init_local()
+
+    def _create_event_log_line(self, time, **kwargs):
+        """Create an event log line with the given time, as a JSON string."""
+        event = {'time': time, 'event_type': 'test_event'}
+        event.update(kwargs)
+        return json.dumps(event)
+
+    def test_event_in_interval(self):
+        line = self._create_event_log_line('2014-03-15T01:02:03.123456+00:00')
+        event, date_string = self.task.get_event_and_date_string(line)
+        self.assertEquals(event['time'], '2014-03-15T01:02:03.123456+00:00')
+        self.assertEquals(date_string, '2014-03-15')
+
+    def test_edge_events(self):
+        self.assertIsNotNone(self.task.get_event_and_date_string(self._create_event_log_line('2014-03-01T00:00:00')))
+        self.assertIsNone(self.task.get_event_and_date_string(self._create_event_log_line('2014-04-01T00:00:00')))
+        self.assertIsNone(self.task.get_event_and_date_string(self._create_event_log_line('2014-02-28T23:59:59')))
+
+    def test_event_outside_interval(self):
+        line = self._create_event_log_line('2014-04-15T01:02:03.123456+00:00')
+        self.assertIsNone(self.task.get_event_and_date_string(line))
+
+    def test_nested_time_with_compact_separators(self):
+        line = '{"time":"2014-03-15T01:02:03.123456+00:00","event":{"time": "2014-04-01T00:00:00"}}'
+        _event, date_string = self.task.get_event_and_date_string(line)
+        self.assertEquals(date_string, '2014-03-15')
+
+    def test_missing_time_counted(self):
+        line = json.dumps({'event_type': 'test_event', 'event': {'time': '2014-04-01T00:00:00'}})
+        with patch.object(self.task, 'incr_counter') as incr_counter_mock:
+            self.assertIsNone(self.task.get_event_and_date_string(line))
+            incr_counter_mock.assert_called_once_with('Event', 'Missing Time Field', 1)
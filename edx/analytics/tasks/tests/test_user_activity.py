@@ -66,7 +66,7 @@ class UserActivityPerIntervalMapTest(InitializeOpaqueKeysMixin, unittest.TestCas
 
     def assert_no_output_for(self, line):
         """Assert that an input line generates no output."""
-        self.assertEquals(tuple(self.task.mapper(line)), tuple())
+        self.assertFalse(list(self.task.mapper(line)))
 
     def test_unparseable_event(self):
         line = 'this is garbage'
@@ -86,7 +86,7 @@ class LastCountryForEachUserMapperTestCase(BaseUserLocationEventTestCase):
 
     def assert_no_output_for(self, line):
         """Assert that an input line generates no output."""
-        self.assertEquals(tuple(self.task.mapper(line)), tuple())
+        self.assertFalse(list(self.task.mapper(line)))
 
     def test_non_enrollment_event(self):
         line = 'this is garbage'
@@ -0,0 +1,29 @@
+"""Helpers for writing many small records to an output file."""
+
+# Number of bytes of lines to accumulate before writing them to the output file.
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+def write_lines_in_batches(output_file, lines):
+    """
+    Writes each line to the output file, followed by a newline.
+
+    Writing each line individually makes two calls to write() per line, which is expensive for output files that
+    compress or encrypt what is written to them, so the lines are joined into larger chunks first.
+
+    Args:
+        output_file: A file-like object to write to.
+        lines (iterable): The lines to write, without trailing newlines.
+    """
+    batch = []
+    batch_size = 0
+    for line in lines:
+        batch.append(line)
+        batch_size += len(line) + 1
+        if batch_size >= WRITE_BUFFER_SIZE:
+            output_file.write('\n'.join(batch) + '\n')
+            batch = []
+            batch_size = 0
+
+    if batch:
+        output_file.write('\n'.join(batch) + '\n')
@@ -17,18 +17,38 @@ COURSE_ID_PATTERN = COURSE_KEY_PATTERN.replace('course_key_string', 'course_id')
 # from common/djangoapps/util/request.py:
 COURSE_REGEX = re.compile(r'^.*?/courses/{}'.format(COURSE_ID_PATTERN))
 
+# The same course_ids show up over and over again in the input of a single map or reduce task, and parsing them is
+# relatively expensive, so the results are memoized. A cache is simply emptied when it reaches this size.
+MAX_CACHED_COURSE_IDS = 4096
+_VALID_COURSE_IDS = set()
+_ORG_ID_FOR_COURSE_ID = {}
+
+
+def _make_room_in_cache(cache):
+    """Empty a cache of course_id results if it has reached its maximum size."""
+    if len(cache) >= MAX_CACHED_COURSE_IDS:
+        cache.clear()
+
 
 def is_valid_course_id(course_id):
     """
     Determines if a course_id from an event log is possibly legitimate.
     """
+    if isinstance(course_id, basestring) and course_id in _VALID_COURSE_IDS:
+        return True
+
     try:
         _course_key = CourseKey.from_string(course_id)
-        return True
     except InvalidKeyError as exc:
         log.error("Unable to parse course_id '%s' : error = %s", course_id, exc)
         return False
 
+    # Only valid course_ids are cached, so that each occurrence of an invalid one is still logged.
+    if isinstance(course_id, basestring):
+        _make_room_in_cache(_VALID_COURSE_IDS)
+        _VALID_COURSE_IDS.add(course_id)
+    return True
+
 
 def is_valid_org_id(org_id):
     """
@@ -50,12 +70,18 @@ def get_org_id_for_course(course_id):
     Returns:
         The org_id extracted from the course_id, or None if none is found.
     """
+    if isinstance(course_id, basestring) and course_id in _ORG_ID_FOR_COURSE_ID:
+        return _ORG_ID_FOR_COURSE_ID[course_id]
 
     try:
-        course_key = CourseKey.from_string(course_id)
-        return course_key.org
+        org_id = CourseKey.from_string(course_id).org
     except InvalidKeyError:
-        return None
+        org_id = None
+
+    if isinstance(course_id, basestring):
+        _make_room_in_cache(_ORG_ID_FOR_COURSE_ID)
+        _ORG_ID_FOR_COURSE_ID[course_id] = org_id
+    return org_id
 
 
 def get_filename_safe_course_id(course_id, replacement_char='_'):
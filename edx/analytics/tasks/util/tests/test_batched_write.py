@@ -0,0 +1,35 @@
+"""Tests for writing lines to output files in batches."""
+
+from mock import Mock
+
+from edx.analytics.tasks.tests import unittest
+from edx.analytics.tasks.util.batched_write import write_lines_in_batches, WRITE_BUFFER_SIZE
+
+
+class WriteLinesInBatchesTest(unittest.TestCase):
+    """Verify that lines are written unchanged, in as few calls as the buffer size allows."""
+
+    def setUp(self):
+        self.output_file = Mock()
+
+    def _get_written_data(self):
+        """Returns everything written to the output file."""
+        return ''.join(args[0] for args, _kwargs in self.output_file.write.call_args_list)
+
+    def test_no_lines(self):
+        write_lines_in_batches(self.output_file, [])
+        self.assertFalse(self.output_file.write.called)
+
+    def test_lines_below_buffer_size(self):
+        lines = ['foo', '', 'bar\tbaz']
+        write_lines_in_batches(self.output_file, iter(lines))
+        self.assertEquals(self._get_written_data(), 'foo\n\nbar\tbaz\n')
+        self.assertEquals(self.output_file.write.call_count, 1)
+
+    def test_lines_above_buffer_size(self):
+        lines = ['x' * 1023] * (WRITE_BUFFER_SIZE / 1024 * 2 + 1)
+        write_lines_in_batches(self.output_file, iter(lines))
+        self.assertEquals(self._get_written_data(), ''.join(line + '\n' for line in lines))
+        self.assertEquals(self.output_file.write.call_count, 3)
+        first_batch = self.output_file.write.call_args_list[0][0][0]
+        self.assertEquals(len(first_batch), WRITE_BUFFER_SIZE)
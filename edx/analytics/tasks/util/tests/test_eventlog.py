@@ -72,6 +72,28 @@ class TimestampTest(unittest.TestCase):
         self.assertEquals(eventlog.datetime_to_timestamp(dt_value), "2013-12-17T15:38:32")
         self.assertEquals(eventlog.datetime_to_datestamp(dt_value), "2013-12-17")
 
+    def test_good_datetime_with_milliseconds(self):
+        item = {"time": "2013-12-17T15:38:32.805"}
+        dt_value = eventlog.get_event_time(item)
+        self.assertIsNotNone(dt_value)
+        self.assertEquals(eventlog.datetime_to_timestamp(dt_value), "2013-12-17T15:38:32.805000")
+
+    def test_bad_datetime(self):
+        bad_times = (
+            "2013-13-17T15:38:32.805444",
+            "2013-12-17 15:38:32.805444",
+            "2013-+2-17T15:38:32.805444",
+            "2013-12-17T15:38:32.805444\n",
+            "this is a bogus time",
+            "",
+        )
+        for bad_time in bad_times:
+            self.assertIsNone(eventlog.get_event_time({"time": bad_time}))
+
+    def test_datetime_without_zero_padding(self):
+        dt_value = eventlog.get_event_time({"time": "2013-1-7T15:38:32.805444"})
+        self.assertEquals(eventlog.datetime_to_timestamp(dt_value), "2013-01-07T15:38:32.805444")
+
 
 class GetEventDataTest(unittest.TestCase):
     """Verify that get_event_data works as expected."""
@@ -2,6 +2,7 @@
 Tests for utilities that parse event logs.
 """
 
+from mock import patch
 from opaque_keys.edx.locator import CourseLocator
 
 import edx.analytics.tasks.util.opaque_key_util as opaque_key_util
@@ -128,3 +129,44 @@ class CourseIdTest(unittest.TestCase):
         url = u"https://courses.edx.org/courses/{course_id}/stuff".format(course_id=INVALID_NONASCII_LEGACY_COURSE_ID)
         course_key = opaque_key_util.get_course_key_from_url(url)
         self.assertIsNone(course_key)
+
+
+class CourseIdCacheTest(unittest.TestCase):
+    """
+    Verify that results of parsing course_ids are memoized.
+    """
+
+    def setUp(self):
+        opaque_key_util._VALID_COURSE_IDS.clear()  # pylint: disable=protected-access
+        opaque_key_util._ORG_ID_FOR_COURSE_ID.clear()  # pylint: disable=protected-access
+        patcher = patch.object(opaque_key_util.CourseKey, 'from_string', wraps=opaque_key_util.CourseKey.from_string)
+        self.from_string_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_valid_course_id_parsed_once(self):
+        self.assertTrue(opaque_key_util.is_valid_course_id(VALID_COURSE_ID))
+        self.assertTrue(opaque_key_util.is_valid_course_id(VALID_COURSE_ID))
+        self.assertEquals(self.from_string_mock.call_count, 1)
+
+    @patch('edx.analytics.tasks.util.opaque_key_util.log')
+    def test_invalid_course_id_logged_every_time(self, mock_log):
+        self.assertFalse(opaque_key_util.is_valid_course_id(INVALID_LEGACY_COURSE_ID))
+        self.assertFalse(opaque_key_util.is_valid_course_id(INVALID_LEGACY_COURSE_ID))
+        self.assertEquals(self.from_string_mock.call_count, 2)
+        self.assertEquals(mock_log.error.call_count, 2)
+
+    def test_org_id_parsed_once(self):
+        self.assertEquals(opaque_key_util.get_org_id_for_course(VALID_LEGACY_COURSE_ID), "org")
+        self.assertEquals(opaque_key_util.get_org_id_for_course(VALID_LEGACY_COURSE_ID), "org")
+        self.assertIsNone(opaque_key_util.get_org_id_for_course(INVALID_LEGACY_COURSE_ID))
+        self.assertIsNone(opaque_key_util.get_org_id_for_course(INVALID_LEGACY_COURSE_ID))
+        self.assertEquals(self.from_string_mock.call_count, 2)
+
+    @patch('edx.analytics.tasks.util.opaque_key_util.MAX_CACHED_COURSE_IDS', 1)
+    def test_cache_is_bounded(self):
+        opaque_key_util.get_org_id_for_course(VALID_LEGACY_COURSE_ID)
+        opaque_key_util.get_org_id_for_course(VALID_COURSE_ID)
+        self.assertEquals(len(opaque_key_util._ORG_ID_FOR_COURSE_ID), 1)  # pylint: disable=protected-access
+        opaque_key_util.is_valid_course_id(VALID_LEGACY_COURSE_ID)
+        opaque_key_util.is_valid_course_id(VALID_COURSE_ID)
+        self.assertEquals(len(opaque_key_util._VALID_COURSE_IDS), 1)  # pylint: disable=protected-access